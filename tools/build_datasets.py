@@ -12,26 +12,67 @@ Outputs JSON schema:
 }
 
 Commands:
-  boc <SERIES_ID> <OUT_JSON> [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--agg mean|last]
+  boc <SERIES_ID> <OUT_JSON> [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--agg mean|last] [--no-cache] [--cache-ttl HOURS]
   shiller <IE_DATA_XLS_PATH> <OUT_JSON>
 
-Requires: pandas, requests, openpyxl (installed commonly), xlrd may be required for .xls on some setups.
+Commands that write JSON accept --pretty for indented output (default: compact).
+
+Requires: pandas, numpy, requests, openpyxl (installed commonly), xlrd may be required for .xls on some setups.
+Optional: pyarrow (faster CSV parsing), orjson (faster JSON output), python-calamine (faster Excel reads).
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import io
 import json
-import math
 import os
 import glob
+import re
+import tempfile
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Literal
 
+import numpy as np
 import pandas as pd
 import requests
 
+try:
+    # Optional: Arrow's multithreaded CSV reader for BOC downloads. Falls back
+    # to the pandas C parser when pyarrow is not installed.
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+try:
+    # Optional: Rust JSON encoder for write_json. Falls back to stdlib json.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: Rust Excel reader, exposed by pandas >= 2.2 as engine="calamine".
+    # Falls back to pandas' default engine (xlrd/openpyxl).
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = "calamine" if tuple(int(x) for x in pd.__version__.split(".")[:2]) >= (2, 2) else None
+except ImportError:
+    _EXCEL_ENGINE = None
+
+# Copy-on-Write makes column subsets lazy views. It is always on from
+# pandas 3.0 (where the option is deprecated); opt in explicitly on 2.x.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 
 BOC_VALET_OBS_CSV = "https://www.bankofcanada.ca/valet/observations/{series}/csv"
+# Raw Valet downloads are cached here, keyed by (series, start, end), so rebuilds skip the network.
+BOC_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "boc")
+BOC_CACHE_TTL_HOURS = 24.0
 FRED_API_BASE = "https://api.stlouisfed.org/fred/series/observations"
 # Note: FRED requires an API key. Get a free key from https://fred.stlouisfed.org/docs/api/api_key.html
 # For testing, you can use "demo" but it has rate limits. Set your key as environment variable FRED_API_KEY
@@ -40,22 +81,98 @@ FRED_API_KEY = os.environ.get("FRED_API_KEY", "demo")
 
 AggMode = Literal["mean", "last"]
 
+# Header row of the BOC observation table: date,FXUSDCAD  OR  "date","FXUSDCAD"  OR  date;...
+# Group 1 is the header itself, group 2 the delimiter after the "date" column name.
+_BOC_HEADER_RE = re.compile(rb'(?m)^[ \t]*(date|"date")([,;])')
+# The metadata block ahead of the header is a few dozen lines; never scan past this.
+_BOC_HEADER_SCAN_BYTES = 64 * 1024
+
+
+def _to_months(months: pd.Series) -> list[str]:
+    """
+    Format months as "YYYY-MM": a datetime64[M] cast stringifies them in one NumPy pass.
+    Accepts datetimes or int64 months-since-epoch keys.
+    """
+    return months.to_numpy(dtype="datetime64[M]").astype(str).tolist()
+
+
+def _to_finite(values: pd.Series) -> pd.Series:
+    """
+    Coerce to float: non-numeric and non-finite entries become NaN.
+    Always returns NumPy float64, so NaN counts as missing even for Arrow-backed input.
+    """
+    v = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(np.where(np.isfinite(v), v, np.nan), index=values.index, name=values.name)
+
+
+def _series_from_cols(dates: list[str], values: list[float]) -> list[dict]:
+    """Zip parallel date/value lists into the output schema [{"date": ..., "value": ...}]."""
+    return [{"date": d, "value": v} for d, v in zip(dates, values)]
+
 
-def _to_month(dt: pd.Timestamp) -> str:
-    return f"{dt.year:04d}-{dt.month:02d}"
+def _column_lookup(columns) -> dict:
+    """Map stripped, lowercased column names to the original labels (normalize once per frame)."""
+    return {str(c).strip().lower(): c for c in columns}
 
 
-def _ensure_finite(x) -> Optional[float]:
+def _frac_to_ym(yf: np.ndarray) -> list[str]:
+    """Convert Shiller year.fraction dates (e.g. 1871.01) to "YYYY-MM" strings."""
+    year = yf.astype(np.int64)
+    frac = yf - year
+    # Shiller often encodes months as .01.. .12
+    m = np.rint(frac * 100).astype(np.int64)
+    bad = (m < 1) | (m > 12)
+    if bad.any():
+        # fallback: approximate from fraction of year
+        m[bad] = np.clip(np.rint(frac[bad] * 12).astype(np.int64) + 1, 1, 12)
+    return [f"{y:04d}-{mo:02d}" for y, mo in zip(year.tolist(), m.tolist())]
+
+
+def _boc_cache_path(series: str, start: Optional[str], end: Optional[str]) -> str:
+    key = hashlib.sha1(f"{series}|{start or ''}|{end or ''}".encode("utf-8")).hexdigest()
+    return os.path.join(BOC_CACHE_DIR, f"{key}.csv")
+
+
+def _read_boc_cache(path: str, ttl_hours: float) -> Optional[bytes]:
+    """Cached response body if present and younger than ttl_hours, else None."""
     try:
-        v = float(x)
-    except Exception:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
         return None
-    if not math.isfinite(v):
+    if age > ttl_hours * 3600:
         return None
-    return v
+    with open(path, "rb") as f:
+        return f.read()
 
 
-def fetch_boc_csv(series: str, start: Optional[str], end: Optional[str]) -> pd.DataFrame:
+def _write_atomic(path: str, data: bytes):
+    """Write data to a temp file beside path, then rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_boc_cache(path: str, body: bytes, url: str, params: dict):
+    # Atomic writes: an interrupted run must not leave a truncated body that
+    # looks fresh to _read_boc_cache for the whole TTL.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _write_atomic(path, body)
+    meta = {"url": url, "params": params, "fetched_at": datetime.now().isoformat(timespec="seconds")}
+    _write_atomic(path[: -len(".csv")] + ".meta.json", json.dumps(meta, indent=2).encode("utf-8"))
+
+
+def fetch_boc_csv(
+    series: str,
+    start: Optional[str],
+    end: Optional[str],
+    use_cache: bool = True,
+    cache_ttl_hours: float = BOC_CACHE_TTL_HOURS,
+) -> pd.DataFrame:
     params = {}
     if start:
         params["start_date"] = start
@@ -63,32 +180,47 @@ def fetch_boc_csv(series: str, start: Optional[str], end: Optional[str]) -> pd.D
         params["end_date"] = end
 
     url = BOC_VALET_OBS_CSV.format(series=series)
-    r = requests.get(url, params=params, timeout=30)
-    r.raise_for_status()
-
-    text = r.text
-    lines = text.splitlines()
+    cache_path = _boc_cache_path(series, start, end)
+    body = _read_boc_cache(cache_path, cache_ttl_hours) if use_cache else None
+    from_cache = body is not None
+
+    if body is None:
+        # Stream the body into a single bytes buffer; it is never decoded to str.
+        # iter_content (unlike copying r.raw) undoes any gzip transfer encoding.
+        buf = io.BytesIO()
+        with requests.get(url, params=params, timeout=30, stream=True) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(chunk_size=1 << 16):
+                buf.write(chunk)
+        body = buf.getvalue()
 
     # Find the real CSV header row that starts the observation table.
     # Bank of Canada Valet CSV often includes metadata lines first.
-    header_idx = None
-    for i, line in enumerate(lines[:200]):
-        s = line.strip().strip('"')
-        # Accept common forms: date,FXUSDCAD  OR  "date","FXUSDCAD"
-        if s.startswith("date,") or s.startswith('date","') or s.startswith('"date",') or s.startswith("date;"):
-            header_idx = i
-            break
-
-    if header_idx is None:
+    m = _BOC_HEADER_RE.search(body, 0, _BOC_HEADER_SCAN_BYTES)
+    if m is None:
         # Helpful debug: show first few lines
-        preview = "\n".join(lines[:15])
+        preview = "\n".join(body[:4096].decode("utf-8", errors="replace").splitlines()[:15])
         raise ValueError(f"Could not locate data header in BOC CSV for {series}. First lines:\n{preview}")
 
-    from io import StringIO
-    data_block = "\n".join(lines[header_idx:])
+    # Only cache downloads that parsed far enough to be a Valet CSV.
+    if use_cache and not from_cache:
+        _write_boc_cache(cache_path, body, url, params)
 
-    # Use python engine for robustness
-    df = pd.read_csv(StringIO(data_block), engine="python")
+    offset = m.start(1)
+    delimiter = m.group(2).decode("ascii")
+
+    # Parse straight from the downloaded bytes: the memoryview slice and the
+    # seeked BytesIO both share body's buffer instead of copying the table.
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            pa.BufferReader(pa.py_buffer(memoryview(body)[offset:])),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+        )
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True)
+    else:
+        data = io.BytesIO(body)
+        data.seek(offset)
+        df = pd.read_csv(data, sep=delimiter, engine="c")
 
     # Normalize column names (strip quotes/whitespace)
     df.columns = [str(c).strip().strip('"') for c in df.columns]
@@ -96,34 +228,110 @@ def fetch_boc_csv(series: str, start: Optional[str], end: Optional[str]) -> pd.D
     return df
 
 
-def boc_to_monthly(series: str, start: Optional[str], end: Optional[str], agg: AggMode) -> list[dict]:
-    df = fetch_boc_csv(series, start, end)
+def boc_to_monthly(
+    series: str,
+    start: Optional[str],
+    end: Optional[str],
+    agg: AggMode,
+    use_cache: bool = True,
+    cache_ttl_hours: float = BOC_CACHE_TTL_HOURS,
+) -> list[dict]:
+    df = fetch_boc_csv(series, start, end, use_cache=use_cache, cache_ttl_hours=cache_ttl_hours)
 
     if "date" not in df.columns or series not in df.columns:
         raise ValueError(f"Unexpected BOC CSV columns for {series}: {df.columns.tolist()}")
 
     df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df["value"] = df[series].apply(_ensure_finite)
+    df["value"] = _to_finite(df[series])
 
-    df = df.dropna(subset=["date"])
-    df = df.dropna(subset=["value"])
+    # Unparseable dates and non-numeric/non-finite values are NaN/NaT by now;
+    # drop both in one pass.
+    df = df.dropna(subset=["date", "value"])
 
     if df.empty:
         raise ValueError(f"No valid observations after cleaning for {series}")
 
-    df["month"] = df["date"].dt.to_period("M").dt.to_timestamp()
+    # Group on an int64 key (months since 1970-01) taken from a datetime64[M]
+    # cast, skipping the Period/Timestamp round-trip.
+    df["month"] = df["date"].to_numpy(dtype="datetime64[M]").astype(np.int64)
 
-    if agg == "mean":
-        m = df.groupby("month", as_index=False)["value"].mean()
-    elif agg == "last":
-        m = df.sort_values("date").groupby("month", as_index=False)["value"].last()
-    else:
+    # Rows must be in date order so each month is one contiguous run. Valet
+    # output is already chronological; the O(N) check avoids sorting it.
+    if not df["date"].is_monotonic_increasing:
+        order = np.argsort(df["date"].to_numpy(), kind="stable")
+        df = df.iloc[order]
+
+    if agg not in ("mean", "last"):
         raise ValueError("agg must be mean or last")
 
-    series_out = [{"date": _to_month(row["month"]), "value": float(row["value"])} for _, row in m.iterrows()]
+    steps = np.diff(df["month"].to_numpy())
+    if np.all(steps > 0):
+        # Already monthly (one observation per month, e.g. CPI or policy
+        # rates): mean and last are the observation itself.
+        m = df
+    elif agg == "mean":
+        # Groups come out month-ordered, so groupby can skip sorting its keys.
+        m = df.groupby("month", as_index=False, sort=False)["value"].mean()
+    else:
+        # The last observation of a month is the final row of its run.
+        run_ends = np.append(np.flatnonzero(steps), len(steps))
+        m = df.iloc[run_ends]
+
+    dates = _to_months(m["month"])
+    values = m["value"].to_numpy(dtype=np.float64).tolist()
+    series_out = _series_from_cols(dates, values)
     return series_out
 
 
+@functools.lru_cache(maxsize=4)
+def _read_shiller_sheet(xls_path: str) -> pd.DataFrame:
+    """
+    Read sheet "Data" of ie_data.xls once, with header=None. Header detection
+    and the data rows both come from this frame (no preview read followed by a
+    second full read of the workbook).
+
+    Cached per path so the equities and CPI builders share one parse. Callers
+    must treat the frame as read-only; Copy-on-Write keeps derived frames from
+    writing through to it.
+    """
+    # No Arrow dtype backend here: the title rows above the header make every
+    # column mixed text/number, which Arrow would turn into strings.
+    return pd.read_excel(xls_path, sheet_name="Data", header=None, engine=_EXCEL_ENGINE)
+
+
+def _preview_rows(df: pd.DataFrame, n: int) -> list[str]:
+    """Render the first n rows as "Row i: [...]" lines for error messages (NaN -> "")."""
+    return [
+        f"Row {idx}: {[str(val) if pd.notna(val) else '' for val in row]}"
+        for idx, row in enumerate(df.head(n).itertuples(index=False))
+    ]
+
+
+def _find_header_row(raw: pd.DataFrame, names: tuple[str, ...], max_rows: int = 50) -> Optional[int]:
+    """First of the top rows containing every name as an exact (case-insensitive) cell value."""
+    for idx, row in enumerate(raw.head(max_rows).itertuples(index=False)):
+        # Row cells as stripped, lowercased strings
+        row_values = {str(val).strip().lower() for val in row if pd.notna(val)}
+        if row_values.issuperset(names):
+            return idx
+    return None
+
+
+def _rows_below_header(raw: pd.DataFrame, header_row: int) -> pd.DataFrame:
+    """
+    Rows of raw below header_row, labelled as read_excel(header=header_row)
+    would: blank cells become "Unnamed: i", repeated names get ".1", ".2", ...
+    """
+    labels = []
+    seen = {}
+    for i, val in enumerate(raw.iloc[header_row].tolist()):
+        label = str(val) if pd.notna(val) else f"Unnamed: {i}"
+        n = seen.get(label, 0)
+        seen[label] = n + 1
+        labels.append(f"{label}.{n}" if n else label)
+    return raw.iloc[header_row + 1:].set_axis(labels, axis=1)
+
+
 def shiller_parse_monthly_tr(xls_path: str) -> list[dict]:
     """
     Reads Shiller 'ie_data.xls' and builds a simple monthly total return index:
@@ -134,42 +342,27 @@ def shiller_parse_monthly_tr(xls_path: str) -> list[dict]:
       - P (price)
       - D (dividend)
     """
-    # 1. Read sheet "Data" with header=None and nrows=50
-    df_preview = pd.read_excel(xls_path, sheet_name="Data", header=None, nrows=50)
+    # 1. Read sheet "Data" once with header=None
+    raw = _read_shiller_sheet(xls_path)
+    df_preview = raw.head(50)
     
     # 2. Locate the header row r by finding the first row containing exact (case-insensitive) values "Date", "P", and "D"
-    header_row = None
-    for idx, row in df_preview.iterrows():
-        # Convert row to list of strings (stripped, lowercased)
-        row_values = [str(val).strip().lower() for val in row.values if pd.notna(val)]
-        
-        # Check if this row contains exact matches for "date", "p", and "d" (case-insensitive)
-        has_date = "date" in row_values
-        has_p = "p" in row_values
-        has_d = "d" in row_values
-        
-        if has_date and has_p and has_d:
-            header_row = idx
-            break
+    header_row = _find_header_row(raw, ("date", "p", "d"))
     
     if header_row is None:
         # 7. If header row not found, raise ValueError that prints the first 15 rows (as lists)
-        first_15_rows = []
-        for idx in range(min(15, len(df_preview))):
-            row = df_preview.iloc[idx]
-            row_list = [str(val) if pd.notna(val) else "" for val in row.values]
-            first_15_rows.append(f"Row {idx}: {row_list}")
+        first_15_rows = _preview_rows(df_preview, 15)
         
         raise ValueError(
             f"Could not find header row with Date, P, D columns in sheet 'Data'.\n"
             f"First 15 rows:\n" + "\n".join(first_15_rows)
         )
     
-    # 3. Re-read the same sheet with header=r so pandas uses that row for column names
-    df = pd.read_excel(xls_path, sheet_name="Data", header=header_row)
+    # 3. Use the rows below r, with that row's cells as column names
+    df = _rows_below_header(raw, header_row)
     
     # 4. Map columns (case-insensitive matching)
-    col_names_lower = {str(c).strip().lower(): c for c in df.columns}
+    col_names_lower = _column_lookup(df.columns)
     
     if "date" not in col_names_lower:
         raise ValueError(f"Column 'Date' not found in sheet 'Data' after header row {header_row}. Columns: {df.columns.tolist()}")
@@ -183,19 +376,17 @@ def shiller_parse_monthly_tr(xls_path: str) -> list[dict]:
     d_col = col_names_lower["d"]
     
     # 5. Extract and clean data
-    tmp = df[[date_col, p_col, d_col]].copy()
-    tmp.columns = ["date_frac", "P", "D"]
-    
-    # Coerce Date/P/D to numeric (errors='coerce'), drop NaNs, require non-empty
-    tmp["date_frac"] = pd.to_numeric(tmp["date_frac"], errors="coerce")
-    tmp["P"] = pd.to_numeric(tmp["P"], errors="coerce")
-    tmp["D"] = pd.to_numeric(tmp["D"], errors="coerce")
+    # Coerce Date/P/D straight to finite float arrays (anything else -> NaN)
+    date_frac = _to_finite(df[date_col]).to_numpy(dtype=np.float64)
+    P = _to_finite(df[p_col]).to_numpy(dtype=np.float64)
+    D = _to_finite(df[d_col]).to_numpy(dtype=np.float64)
     
     # Drop rows where any are NaN
-    tmp = tmp.dropna(subset=["date_frac", "P", "D"])
+    valid = ~(np.isnan(date_frac) | np.isnan(P) | np.isnan(D))
+    date_frac, P, D = date_frac[valid], P[valid], D[valid]
     
     # Require non-empty
-    if tmp.empty:
+    if date_frac.size == 0:
         raise ValueError(
             f"After cleaning, no rows remain.\n"
             f"Detected header row: {header_row}\n"
@@ -203,53 +394,42 @@ def shiller_parse_monthly_tr(xls_path: str) -> list[dict]:
         )
     
     # Ensure at least 1000 rows remain
-    if len(tmp) < 1000:
-        first_5_rows = tmp.head(5).to_dict('records')
+    if date_frac.size < 1000:
+        first_5_rows = [
+            {"date_frac": f, "P": p, "D": d}
+            for f, p, d in zip(date_frac[:5].tolist(), P[:5].tolist(), D[:5].tolist())
+        ]
         raise ValueError(
-            f"After cleaning, only {len(tmp)} rows remain (expected >= 1000).\n"
+            f"After cleaning, only {date_frac.size} rows remain (expected >= 1000).\n"
             f"Detected header row: {header_row}\n"
             f"Detected columns: Date='{date_col}', P='{p_col}', D='{d_col}'\n"
             f"First 5 rows:\n{first_5_rows}"
         )
     
     # 6. Convert year.fraction -> month (keep existing conversion)
-    def frac_to_ym(yf: float) -> str:
-        year = int(yf)
-        frac = yf - year
-        # Shiller often encodes months as .01.. .12
-        m = int(round(frac * 100))
-        if m < 1 or m > 12:
-            # fallback: approximate from fraction of year
-            m = int(round(frac * 12)) + 1
-            m = min(12, max(1, m))
-        return f"{year:04d}-{m:02d}"
-    
-    tmp["ym"] = tmp["date_frac"].apply(frac_to_ym)
-    tmp = tmp.sort_values("ym")
+    ym = np.array(_frac_to_ym(date_frac))
+    # De-duplicate up front (last row per month wins) so the TR chain below
+    # runs once over unique, sorted months and needs no post-hoc dedup.
+    # "YYYY-MM" sorts chronologically; np.unique on the reversed months
+    # returns each month's last row.
+    ym, last = np.unique(ym[::-1], return_index=True)
+    rows = len(P) - 1 - last
+    P, D = P[rows], D[rows]
     
     # Build TR index: TR_t = TR_{t-1} * (P_t + D_t) / P_{t-1}
-    tr = []
-    prev_p = None
-    tr_val = 1.0
-    for _, row in tmp.iterrows():
-        p = row["P"]
-        d = row["D"]
-        ym = row["ym"]
-        if prev_p is None:
-            prev_p = p
-            tr.append({"date": ym, "value": tr_val})
-            continue
-        if prev_p <= 0:
-            raise ValueError("Encountered non-positive prior price in Shiller data.")
-        tr_val = tr_val * ((p + d) / prev_p)
-        prev_p = p
-        tr.append({"date": ym, "value": float(tr_val)})
-    
-    # De-duplicate in case of repeats
-    out = {}
-    for pt in tr:
-        out[pt["date"]] = pt["value"]
-    series_out = [{"date": k, "value": out[k]} for k in sorted(out.keys())]
+    # Vectorized as a cumulative product of the per-month ratios (TR_0 = 1.0).
+    bad = np.flatnonzero(P[:-1] <= 0)
+    if bad.size:
+        raise ValueError(f"Encountered non-positive prior price in Shiller data at {ym[bad[0]]}.")
+    # Computed in place in a single buffer: no temporaries for the sum,
+    # quotient or running product.
+    tr_vals = np.empty_like(P)
+    tr_vals[0] = 1.0
+    np.add(P[1:], D[1:], out=tr_vals[1:])
+    np.divide(tr_vals[1:], P[:-1], out=tr_vals[1:])
+    np.cumprod(tr_vals, out=tr_vals)
+    
+    series_out = _series_from_cols(ym.tolist(), tr_vals.tolist())
     
     if not series_out:
         raise ValueError("Shiller TR calculation produced empty series.")
@@ -257,7 +437,32 @@ def shiller_parse_monthly_tr(xls_path: str) -> list[dict]:
     return series_out
 
 
-def write_json(out_path: str, source: str, frequency: str, series: list[dict]):
+def _iter_json_indented(payload: dict):
+    """
+    Yield the same text as json.dump(payload, indent=2, ensure_ascii=False)
+    for the dataset schema, formatting each series row directly instead of
+    going through json's pure-Python indenting encoder.
+    """
+    yield "{"
+    for key, value in payload.items():
+        if key != "series":
+            yield f"\n  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},"
+    yield '\n  "series": ['
+    sep = "\n"
+    for item in payload["series"]:
+        value = item["value"]
+        # float.__repr__ is what json uses for floats; ints and anything else go through json
+        value_text = float.__repr__(value) if type(value) is float else json.dumps(value)
+        yield f'{sep}    {{\n      "date": {json.dumps(item["date"])},\n      "value": {value_text}\n    }}'
+        sep = ",\n"
+    yield "\n  ]\n}"
+
+
+def write_json(out_path: str, source: str, frequency: str, series: list[dict], pretty: bool = False):
+    """
+    Validate and write a dataset. Output is compact JSON (the calculators only
+    parse it); pretty=True writes the 2-space indented form for human diffs.
+    """
     if not series:
         raise ValueError("Refusing to write empty series.")
     
@@ -266,14 +471,18 @@ def write_json(out_path: str, source: str, frequency: str, series: list[dict]):
         raise ValueError(f"Series has only {len(series)} observations, expected >= 100 for long history")
     
     # Validation: Check dates are monotonic
-    for i in range(1, len(series)):
-        if series[i]["date"] <= series[i-1]["date"]:
-            raise ValueError(f"Dates are not monotonic: {series[i-1]['date']} >= {series[i]['date']}")
+    dates = np.array([item["date"] for item in series])
+    not_increasing = dates[1:] <= dates[:-1]
+    if not_increasing.any():
+        i = int(np.argmax(not_increasing)) + 1
+        raise ValueError(f"Dates are not monotonic: {series[i-1]['date']} >= {series[i]['date']}")
     
     # Validation: Check for NaN/Infinity
-    for item in series:
-        if not math.isfinite(item["value"]):
-            raise ValueError(f"Non-finite value found in series at {item['date']}: {item['value']}")
+    values = np.fromiter((item["value"] for item in series), dtype=np.float64, count=len(series))
+    finite = np.isfinite(values)
+    if not finite.all():
+        item = series[int(np.argmin(finite))]
+        raise ValueError(f"Non-finite value found in series at {item['date']}: {item['value']}")
     
     start = series[0]["date"]
     end = series[-1]["date"]
@@ -288,8 +497,15 @@ def write_json(out_path: str, source: str, frequency: str, series: list[dict]):
     # Ensure output directory exists
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(out_path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(out_path, "w", encoding="utf-8") as f:
+            if pretty:
+                f.writelines(_iter_json_indented(payload))
+            else:
+                f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
     print(f"Wrote {out_path} ({len(series)} points) [{start} → {end}]")
 
 
@@ -311,14 +527,29 @@ def find_statcan_fx_csv(raw_dir: str = "tools/raw") -> str:
     if not candidates:
         raise ValueError(f"No CSV files found in {raw_dir}")
     
+    # The file listing is the cache key, so adding or removing a CSV re-runs detection
+    return _detect_statcan_fx_csv(raw_dir, tuple(candidates))
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_statcan_fx_csv(raw_dir: str, candidates: tuple[str, ...]) -> str:
+    """First candidate CSV with StatCan FX columns; cached per file listing."""
     # Try each CSV to find one with StatCan FX structure
     for csv_path in candidates:
         try:
-            df = pd.read_csv(csv_path, nrows=10)
+            # Cheap byte sniff first: only files whose head mentions all three
+            # column names are handed to pandas.
+            with open(csv_path, "rb") as f:
+                head = f.read(4096)
+            head_upper = head.upper()
+            if b"SYMBOL" not in head or b"REF_DATE" not in head_upper or b"VALUE" not in head_upper:
+                continue
+            
+            columns = pd.read_csv(csv_path, nrows=0).columns
             # Check if it has StatCan FX structure: REF_DATE, VALUE, and SYMBOL columns
-            has_ref_date = any("ref_date" in str(c).lower() for c in df.columns)
-            has_value = "VALUE" in df.columns or "Value" in df.columns
-            has_symbol = "SYMBOL" in df.columns
+            has_ref_date = any("ref_date" in str(c).lower() for c in columns)
+            has_value = "VALUE" in columns or "Value" in columns
+            has_symbol = "SYMBOL" in columns
             
             if has_ref_date and has_value and has_symbol:
                 return csv_path
@@ -336,42 +567,36 @@ def read_fred_csv(csv_path: str) -> pd.DataFrame:
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"FRED CSV file not found: {csv_path}")
     
-    df = pd.read_csv(csv_path)
-    
-    # FRED CSV typically has DATE and VALUE columns
-    # Handle different possible column names
-    date_col = None
-    value_col = None
+    # Peek at the header row only to identify the columns
+    columns = pd.read_csv(csv_path, nrows=0).columns
     
-    for col in df.columns:
-        col_lower = str(col).strip().lower()
-        if col_lower in ("date", "observation_date"):
-            date_col = col
-        elif col_lower != "date" and col_lower != "observation_date":
-            # Value column is any column that's not the date column
-            value_col = col
-            break
-    
-    # If value_col not found, use second column (after date)
-    if value_col is None and len(df.columns) >= 2:
-        value_col = df.columns[1]
+    # FRED CSV typically has DATE and VALUE columns: the date column is the one
+    # named date/observation_date, the value column is the first other column
+    date_col = next((c for c in columns if str(c).strip().lower() in ("date", "observation_date")), None)
+    value_col = next((c for c in columns if c != date_col), None)
     
     if date_col is None or value_col is None:
-        raise ValueError(f"Could not find DATE and VALUE columns in {csv_path}. Columns: {df.columns.tolist()}")
-    
-    df = df[[date_col, value_col]].copy()
-    df.columns = ["date", "value"]
-    
-    # FRED uses "." for missing values
-    df = df[df["value"] != "."]
-    
-    if df.empty:
-        raise ValueError(f"No valid observations after filtering in {csv_path}")
+        raise ValueError(f"Could not find DATE and VALUE columns in {csv_path}. Columns: {columns.tolist()}")
+    
+    # FRED uses "." for missing values. usecols skips any extra columns of
+    # multi-series exports.
+    df = pd.read_csv(
+        csv_path,
+        engine="pyarrow" if pa is not None else "c",
+        usecols=[date_col, value_col],
+        na_values=["."],
+    )
+    df = df[[date_col, value_col]].set_axis(["date", "value"], axis=1)
     
+    # Coerce after the read so a stray bad cell becomes NaN/NaT and is dropped
+    # below, instead of failing the whole file.
     df["date"] = pd.to_datetime(df["date"], errors="coerce")
     df["value"] = pd.to_numeric(df["value"], errors="coerce")
     
     df = df.dropna(subset=["date", "value"])
+    if df.empty:
+        raise ValueError(f"No valid observations after filtering in {csv_path}")
+    
     df = df.sort_values("date")
     
     return df
@@ -386,38 +611,34 @@ def fred_csv_to_monthly_index(csv_path: str, source_label: str, yield_to_return:
     """
     df = read_fred_csv(csv_path)
     
-    # Convert to monthly
-    df["month"] = df["date"].dt.to_period("M").dt.to_timestamp()
+    # Convert to monthly on an int64 month key (as in boc_to_monthly).
+    # read_fred_csv returns rows sorted by date, so groups come out
+    # month-ordered and groupby can skip sorting its keys.
+    df["month"] = df["date"].to_numpy(dtype="datetime64[M]").astype(np.int64)
     
     if yield_to_return:
         # Aggregate to monthly (mean of daily values for yields)
-        monthly = df.groupby("month", as_index=False)["value"].mean()
+        monthly = df.groupby("month", as_index=False, sort=False)["value"].mean()
         
         # Convert annual yield to monthly return: (1 + y/100)^(1/12) - 1
-        monthly["monthly_return"] = monthly["value"].apply(
-            lambda y: math.pow(1 + y / 100, 1/12) - 1 if y > 0 else 0
-        )
+        y = monthly["value"].to_numpy(dtype=np.float64)
+        monthly_return = np.where(y > 0, np.power(1.0 + y / 100.0, 1.0 / 12.0) - 1.0, 0.0)
         
         # Build cumulative index starting at 1.0
-        index_value = 1.0
-        series_out = []
-        for _, row in monthly.iterrows():
-            index_value *= (1 + row["monthly_return"])
-            series_out.append({
-                "date": _to_month(row["month"]),
-                "value": float(index_value)
-            })
+        index_values = np.cumprod(1.0 + monthly_return)
+        dates = _to_months(monthly["month"])
+        series_out = _series_from_cols(dates, index_values.tolist())
     else:
         # For CPI and FX: aggregate to monthly
         if use_mean:
-            monthly = df.groupby("month", as_index=False)["value"].mean()
+            monthly = df.groupby("month", as_index=False, sort=False)["value"].mean()
         else:
-            monthly = df.groupby("month", as_index=False)["value"].last()  # Use last value of month
+            # Use last value of month: rows are date-sorted, so keep each month's final row
+            monthly = df.drop_duplicates("month", keep="last")
         
-        series_out = [
-            {"date": _to_month(row["month"]), "value": float(row["value"])}
-            for _, row in monthly.iterrows()
-        ]
+        dates = _to_months(monthly["month"])
+        values = monthly["value"].to_numpy(dtype=np.float64).tolist()
+        series_out = _series_from_cols(dates, values)
     
     return series_out
 
@@ -430,9 +651,9 @@ def build_equities_shiller(xls_path: str) -> list[dict]:
 
 def build_cpi_shiller(xls_path: str) -> list[dict]:
     """Build CPI index from Shiller data."""
-    # 1. Read sheet "Data" with header=None, nrows=50
+    # 1. Read sheet "Data" once with header=None
     try:
-        df_preview = pd.read_excel(xls_path, sheet_name="Data", header=None, nrows=50)
+        raw = _read_shiller_sheet(xls_path)
     except Exception as e:
         # If "Data" sheet doesn't exist, show available sheets
         wb = pd.ExcelFile(xls_path)
@@ -441,29 +662,15 @@ def build_cpi_shiller(xls_path: str) -> list[dict]:
             f"Available sheets: {wb.sheet_names}\n"
             f"Error: {e}"
         )
+    df_preview = raw.head(50)
     
     # 2. Find header row r containing "Date" and "CPI" (case-insensitive exact match after stripping)
-    header_row = None
-    for idx, row in df_preview.iterrows():
-        # Convert row to list of strings (stripped, lowercased)
-        row_values = [str(val).strip().lower() for val in row.values if pd.notna(val)]
-        
-        # Check if this row contains exact matches for "date" and "cpi" (case-insensitive)
-        has_date = "date" in row_values
-        has_cpi = "cpi" in row_values
-        
-        if has_date and has_cpi:
-            header_row = idx
-            break
+    header_row = _find_header_row(raw, ("date", "cpi"))
     
     if header_row is None:
         # 6. If header row not found, raise an error that prints sheet names and first 15 rows
         wb = pd.ExcelFile(xls_path)
-        first_15_rows = []
-        for idx in range(min(15, len(df_preview))):
-            row = df_preview.iloc[idx]
-            row_list = [str(val) if pd.notna(val) else "" for val in row.values]
-            first_15_rows.append(f"Row {idx}: {row_list}")
+        first_15_rows = _preview_rows(df_preview, 15)
         
         raise ValueError(
             f"Could not find header row with Date and CPI columns in sheet 'Data'.\n"
@@ -471,11 +678,11 @@ def build_cpi_shiller(xls_path: str) -> list[dict]:
             f"First 15 rows from 'Data' sheet:\n" + "\n".join(first_15_rows)
         )
     
-    # Re-read sheet "Data" with header=r
-    df = pd.read_excel(xls_path, sheet_name="Data", header=header_row)
+    # Use the rows below r, with that row's cells as column names
+    df = _rows_below_header(raw, header_row)
     
     # 2. Column mapping (case-insensitive)
-    col_names_lower = {str(c).strip().lower(): c for c in df.columns}
+    col_names_lower = _column_lookup(df.columns)
     
     if "date" not in col_names_lower:
         raise ValueError(f"Column 'Date' not found in sheet 'Data' after header row {header_row}. Columns: {df.columns.tolist()}")
@@ -486,15 +693,13 @@ def build_cpi_shiller(xls_path: str) -> list[dict]:
     cpi_col = col_names_lower["cpi"]
     
     # 3. Extract and clean data
-    tmp = df[[date_col, cpi_col]].copy()
-    tmp.columns = ["date_frac", "CPI"]
-    
-    # Coerce both to numeric (errors='coerce'), drop NaNs
-    tmp["date_frac"] = pd.to_numeric(tmp["date_frac"], errors="coerce")
-    tmp["CPI"] = pd.to_numeric(tmp["CPI"], errors="coerce")
-    tmp = tmp.dropna(subset=["date_frac", "CPI"])
+    # Coerce both straight to float arrays (errors -> NaN), drop NaNs
+    date_frac = pd.to_numeric(df[date_col], errors="coerce").to_numpy(dtype=np.float64)
+    cpi = pd.to_numeric(df[cpi_col], errors="coerce").to_numpy(dtype=np.float64)
+    valid = ~(np.isnan(date_frac) | np.isnan(cpi))
+    date_frac, cpi = date_frac[valid], cpi[valid]
     
-    if tmp.empty:
+    if date_frac.size == 0:
         raise ValueError(
             f"After cleaning, no rows remain.\n"
             f"Detected header row: {header_row}\n"
@@ -502,29 +707,12 @@ def build_cpi_shiller(xls_path: str) -> list[dict]:
         )
     
     # 4. Convert Shiller date format (year.fraction like 1871.01) to YYYY-MM using same conversion as equities
-    def frac_to_ym(yf: float) -> str:
-        year = int(yf)
-        frac = yf - year
-        # Shiller often encodes months as .01.. .12
-        m = int(round(frac * 100))
-        if m < 1 or m > 12:
-            # fallback: approximate from fraction of year
-            m = int(round(frac * 12)) + 1
-            m = min(12, max(1, m))
-        return f"{year:04d}-{m:02d}"
-    
-    tmp["ym"] = tmp["date_frac"].apply(frac_to_ym)
-    tmp = tmp.sort_values("ym")
+    # De-duplicate in case of repeats (first value per month wins): np.unique
+    # returns sorted months with the index of each month's first row.
+    ym, first = np.unique(np.array(_frac_to_ym(date_frac)), return_index=True)
     
     # 5. Return series sorted by date, schema [{"date":"YYYY-MM","value":float}]
-    # De-duplicate in case of repeats
-    out = {}
-    for _, row in tmp.iterrows():
-        ym = row["ym"]
-        if ym not in out:
-            out[ym] = row["CPI"]
-    
-    series_out = [{"date": k, "value": float(out[k])} for k in sorted(out.keys())]
+    series_out = _series_from_cols(ym.tolist(), cpi[first].tolist())
     
     if not series_out:
         raise ValueError("Shiller CPI calculation produced empty series.")
@@ -553,9 +741,8 @@ def build_usdcad_fx_fred(csv_path: str) -> list[dict]:
 
 
 def statcan_fx_csv_to_series(csv_path: str) -> list[dict]:
-    import pandas as pd
-
-    df = pd.read_csv(csv_path)
+    # SYMBOL repeats a handful of currency codes, so read it as a categorical
+    df = pd.read_csv(csv_path, dtype={"SYMBOL": "category"})
 
     # Check if SYMBOL column exists
     if "SYMBOL" not in df.columns:
@@ -565,13 +752,10 @@ def statcan_fx_csv_to_series(csv_path: str) -> list[dict]:
     if df["SYMBOL"].isna().all():
         raise ValueError("SYMBOL column exists but contains no values (all NaN) in StatCan CSV. Cannot filter by SYMBOL.")
 
+    columns = _column_lookup(df.columns)
+
     # Identify date column
-    date_col = None
-    for c in df.columns:
-        cl = str(c).strip().lower()
-        if cl in ("ref_date", "reference period", "refdate"):
-            date_col = c
-            break
+    date_col = next((columns[c] for c in ("ref_date", "reference period", "refdate") if c in columns), None)
     if date_col is None:
         raise ValueError(f"Could not find date column in StatCan CSV. Columns: {df.columns.tolist()}")
 
@@ -589,20 +773,23 @@ def statcan_fx_csv_to_series(csv_path: str) -> list[dict]:
     df = df.dropna(subset=[date_col, "value"])
 
     # Filter to USD rows using SYMBOL column (case-insensitive)
-    # Handle NaN values: only check non-null SYMBOL values
-    df = df[df["SYMBOL"].notna() & (df["SYMBOL"].astype(str).str.strip().str.upper() == "USD")]
+    # Normalize the few categories, not every row, then match on the codes;
+    # NaN SYMBOL values have code -1 and never match.
+    symbol = df["SYMBOL"].cat
+    usd_codes = np.flatnonzero(symbol.categories.astype(str).str.strip().str.upper() == "USD")
+    df = df[np.isin(symbol.codes.to_numpy(), usd_codes)]
     if df.empty:
         raise ValueError("No rows found with SYMBOL == 'USD' in StatCan CSV")
 
-    df["month"] = df[date_col].dt.to_period("M").dt.to_timestamp()
+    df["month"] = df[date_col].to_numpy(dtype="datetime64[M]").astype(np.int64)
     df = df.sort_values("month")
 
-    monthly = df.groupby("month", as_index=False)["value"].mean()
+    # Rows are month-sorted above, so groupby can skip sorting its keys
+    monthly = df.groupby("month", as_index=False, sort=False)["value"].mean()
 
-    series = [
-        {"date": f"{row['month'].year:04d}-{row['month'].month:02d}", "value": float(row["value"])}
-        for _, row in monthly.iterrows()
-    ]
+    dates = _to_months(monthly["month"])
+    values = monthly["value"].to_numpy(dtype=np.float64).tolist()
+    series = _series_from_cols(dates, values)
     
     return series
 
@@ -611,19 +798,36 @@ def main():
     ap = argparse.ArgumentParser()
     sub = ap.add_subparsers(dest="cmd", required=True)
 
-    ap_boc = sub.add_parser("boc", help="Download + convert a Bank of Canada Valet series to monthly JSON.")
+    # Options shared by every subcommand that writes JSON
+    ap_out = argparse.ArgumentParser(add_help=False)
+    ap_out.add_argument("--pretty", action="store_true", help="Write indented JSON instead of compact output")
+
+    ap_boc = sub.add_parser(
+        "boc", parents=[ap_out], help="Download + convert a Bank of Canada Valet series to monthly JSON."
+    )
     ap_boc.add_argument("series_id")
     ap_boc.add_argument("out_json")
     ap_boc.add_argument("--start", default=None, help="YYYY-MM-DD")
     ap_boc.add_argument("--end", default=None, help="YYYY-MM-DD")
     ap_boc.add_argument("--agg", default="mean", choices=["mean", "last"], help="Monthly aggregation method")
+    ap_boc.add_argument("--no-cache", action="store_true", help="Always download; do not read or write tools/.cache/boc")
+    ap_boc.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=BOC_CACHE_TTL_HOURS,
+        metavar="HOURS",
+        help=f"Hours a cached download stays fresh (default: {BOC_CACHE_TTL_HOURS:g})"
+    )
 
-    ap_sh = sub.add_parser("shiller", help="Convert Shiller ie_data.xls to a monthly total return index JSON.")
+    ap_sh = sub.add_parser(
+        "shiller", parents=[ap_out], help="Convert Shiller ie_data.xls to a monthly total return index JSON."
+    )
     ap_sh.add_argument("xls_path")
     ap_sh.add_argument("out_json")
 
     ap_sc = sub.add_parser(
         "statcan_fx",
+        parents=[ap_out],
         help="Convert StatCan FX table CSV (33-10-0163-01) to monthly JSON for USD/CAD. Auto-detects CSV in tools/raw/."
     )
     ap_sc.add_argument(
@@ -644,6 +848,7 @@ def main():
 
     ap_build = sub.add_parser(
         "build_all",
+        parents=[ap_out],
         help="Build all six investment datasets (equities, cash, bonds, GIC, CPI, FX)"
     )
     ap_build.add_argument(
@@ -656,15 +861,28 @@ def main():
         default="assets/data",
         help="Output directory for JSON files (default: assets/data)"
     )
+    ap_build.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Datasets to build concurrently (default: CPU count; 1 = sequential)"
+    )
 
     args = ap.parse_args()
 
     if args.cmd == "boc":
-        series = boc_to_monthly(args.series_id, args.start, args.end, args.agg)
-        write_json(args.out_json, source="Bank of Canada Valet API", frequency="monthly", series=series)
+        series = boc_to_monthly(
+            args.series_id,
+            args.start,
+            args.end,
+            args.agg,
+            use_cache=not args.no_cache,
+            cache_ttl_hours=args.cache_ttl,
+        )
+        write_json(args.out_json, source="Bank of Canada Valet API", frequency="monthly", series=series, pretty=args.pretty)
     elif args.cmd == "shiller":
         series = shiller_parse_monthly_tr(args.xls_path)
-        write_json(args.out_json, source="Yale / Shiller (ie_data.xls)", frequency="monthly", series=series)
+        write_json(args.out_json, source="Yale / Shiller (ie_data.xls)", frequency="monthly", series=series, pretty=args.pretty)
     elif args.cmd == "statcan_fx":
         csv_path = args.csv_path
         if csv_path is None:
@@ -676,7 +894,8 @@ def main():
             args.out_json,
             source="Statistics Canada (Table 33-10-0163-01)",
             frequency="monthly",
-            series=series
+            series=series,
+            pretty=args.pretty
         )
     elif args.cmd == "build_all":
         raw_dir = args.raw_dir
@@ -693,75 +912,65 @@ def main():
         dgs5_csv = os.path.join(raw_dir, "DGS5.csv")
         dexca_us_csv = os.path.join(raw_dir, "DEXCAUS.csv")
         
-        # 1. Equities
-        print("\n1. Building equities total return index...")
-        if not os.path.exists(shiller_xls):
-            raise FileNotFoundError(f"Shiller file not found: {shiller_xls}")
-        equities_series = build_equities_shiller(shiller_xls)
-        write_json(
-            os.path.join(out_dir, "equities_us_tr.json"),
-            source="Shiller S&P 500 Total Return (P+D)",
-            frequency="monthly",
-            series=equities_series
-        )
-        
-        # 2. CPI
-        print("\n2. Building CPI index...")
-        cpi_series = build_cpi_shiller(shiller_xls)
-        write_json(
-            os.path.join(out_dir, "cpi_us.json"),
-            source="Shiller CPI",
-            frequency="monthly",
-            series=cpi_series
-        )
+        for path, label in [
+            (shiller_xls, "Shiller file"),
+            (dtb3_csv, "DTB3 CSV"),
+            (dgs10_csv, "DGS10 CSV"),
+            (dgs5_csv, "DGS5 CSV"),
+            (dexca_us_csv, "DEXCAUS CSV"),
+        ]:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"{label} not found: {path}")
         
-        # 3. Cash
-        print("\n3. Building cash/T-bill total return index...")
-        if not os.path.exists(dtb3_csv):
-            raise FileNotFoundError(f"DTB3 CSV not found: {dtb3_csv}")
-        cash_series = build_cash_fred(dtb3_csv)
-        write_json(
-            os.path.join(out_dir, "cash_tr.json"),
-            source="FRED DTB3 – 3-Month T-Bill (yield → index)",
-            frequency="monthly",
-            series=cash_series
-        )
+        # Each group runs in its own worker; the datasets are independent.
+        # Equities and CPI share a group so they reuse one parse of ie_data.xls.
+        groups = [
+            [
+                (1, "equities total return index", build_equities_shiller, shiller_xls,
+                 "equities_us_tr.json", "Shiller S&P 500 Total Return (P+D)"),
+                (2, "CPI index", build_cpi_shiller, shiller_xls,
+                 "cpi_us.json", "Shiller CPI"),
+            ],
+            [(3, "cash/T-bill total return index", build_cash_fred, dtb3_csv,
+              "cash_tr.json", "FRED DTB3 – 3-Month T-Bill (yield → index)")],
+            [(4, "10-year bonds total return index", build_bonds10y_fred, dgs10_csv,
+              "bonds10y_tr.json", "FRED GS10 – 10-Year Treasury (yield proxy → index)")],
+            [(5, "5-year GIC proxy total return index", build_gic5y_proxy_fred, dgs5_csv,
+              "gic5y_proxy_tr.json", "FRED GS5 – 5-Year Treasury (GIC proxy, yield → index)")],
+            [(6, "USD/CAD exchange rate", build_usdcad_fx_fred, dexca_us_csv,
+              "usdcad_fx.json", "FRED DEXCAUS – CAD per USD")],
+        ]
         
-        # 4. Bonds 10Y
-        print("\n4. Building 10-year bonds total return index...")
-        if not os.path.exists(dgs10_csv):
-            raise FileNotFoundError(f"DGS10 CSV not found: {dgs10_csv}")
-        bonds_series = build_bonds10y_fred(dgs10_csv)
-        write_json(
-            os.path.join(out_dir, "bonds10y_tr.json"),
-            source="FRED GS10 – 10-Year Treasury (yield proxy → index)",
-            frequency="monthly",
-            series=bonds_series
-        )
+        def run_group(steps):
+            built = []
+            for num, label, builder, in_path, out_name, source in steps:
+                try:
+                    series = builder(in_path)
+                except Exception as e:
+                    raise RuntimeError(f"{num}. {label}: {e}") from e
+                built.append((num, label, out_name, source, series))
+            return built
         
-        # 5. GIC 5Y Proxy
-        print("\n5. Building 5-year GIC proxy total return index...")
-        if not os.path.exists(dgs5_csv):
-            raise FileNotFoundError(f"DGS5 CSV not found: {dgs5_csv}")
-        gic_series = build_gic5y_proxy_fred(dgs5_csv)
-        write_json(
-            os.path.join(out_dir, "gic5y_proxy_tr.json"),
-            source="FRED GS5 – 5-Year Treasury (GIC proxy, yield → index)",
-            frequency="monthly",
-            series=gic_series
-        )
+        # Threads rather than processes: pandas/NumPy release the GIL in the
+        # heavy parts, and workers start without re-importing pandas.
+        # Workers only build series. Results are collected in submission order
+        # and nothing is written until every group has succeeded, so a failed
+        # run leaves the output directory untouched and the log is always in
+        # step order.
+        jobs = max(1, min(args.jobs, len(groups)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(run_group, steps) for steps in groups]
+            results = [step for future in futures for step in future.result()]
         
-        # 6. FX
-        print("\n6. Building USD/CAD exchange rate...")
-        if not os.path.exists(dexca_us_csv):
-            raise FileNotFoundError(f"DEXCAUS CSV not found: {dexca_us_csv}")
-        fx_series = build_usdcad_fx_fred(dexca_us_csv)
-        write_json(
-            os.path.join(out_dir, "usdcad_fx.json"),
-            source="FRED DEXCAUS – CAD per USD",
-            frequency="monthly",
-            series=fx_series
-        )
+        for num, label, out_name, source, series in results:
+            print(f"\n{num}. Building {label}...")
+            write_json(
+                os.path.join(out_dir, out_name),
+                source=source,
+                frequency="monthly",
+                series=series,
+                pretty=args.pretty
+            )
         
         print("\n" + "=" * 60)
         print("All datasets built successfully!")